@@ -14,10 +14,10 @@ from mapa.raster import (
     cut_array_to_square,
     determine_elevation_scale,
     merge_tiffs,
+    merge_tiffs_in_memory,
     remove_empty_first_and_last_rows_and_cols,
     tiff_to_array,
 )
-from mapa.stac import fetch_stac_items_for_bbox
 from mapa.stl_file import save_to_stl_file
 from mapa.tiling import get_x_y_from_tiles_format, split_array_into_tiles
 from mapa.utils import TMPDIR, ProgressBar, path_to_clipped_tiff
@@ -56,8 +56,9 @@ def convert_array_to_stl(
             log.debug("🔍  reducing image resolution...")
             array = reduce_resolution(array, bin_factor=bin_fac)
 
+    # stl files store single precision floats only, thus there is no need to keep the triangles in double precision
     triangles = compute_all_triangles(
-        array, desired_size, z_offset, z_scale, elevation_scale
+        array, desired_size, z_offset, z_scale, elevation_scale, dtype=np.float32
     )
     log.debug("💾  saving data to stl file...")
 
@@ -90,9 +91,9 @@ def convert_tiff_to_stl(
         input=input_file, output=output_file
     )
 
-    tiff = rio.open(input_file)
-    elevation_scale = determine_elevation_scale(tiff, model_size)
-    array = tiff_to_array(tiff)
+    with rio.open(input_file) as tiff:
+        elevation_scale = determine_elevation_scale(tiff, model_size)
+        array = tiff_to_array(tiff)
 
     if ensure_squared:
         array = cut_array_to_square(array)
@@ -119,14 +120,21 @@ def _fetch_merge_and_clip_tiffs(
     cache_dir: Path,
     progress_bar: Union[None, ProgressBar] = None,
 ) -> Path:
+    # the STAC client stack is slow to import and not needed by e.g. dem2stl, thus only import it when fetching data
+    from mapa.stac import fetch_stac_items_for_bbox
+
     tiffs = fetch_stac_items_for_bbox(
         bbox_geojson, allow_caching, cache_dir, progress_bar
     )
-    if len(tiffs) > 1:
+    if len(tiffs) == 1:
+        return clip_tiff_to_bbox(tiffs[0], bbox_geojson, bbox_hash, cache_dir)
+    elif allow_caching:
         merged_tiff = merge_tiffs(tiffs, bbox_hash, cache_dir)
+        return clip_tiff_to_bbox(merged_tiff, bbox_geojson, bbox_hash, cache_dir)
     else:
-        merged_tiff = tiffs[0]
-    return clip_tiff_to_bbox(merged_tiff, bbox_geojson, bbox_hash, cache_dir)
+        # without caching the merged tiff is not reused, thus there is no need to write it to disk
+        with merge_tiffs_in_memory(tiffs) as merged_tiff:
+            return clip_tiff_to_bbox(merged_tiff, bbox_geojson, bbox_hash, cache_dir)
 
 
 def _get_tiff_for_bbox(
@@ -229,9 +237,9 @@ def convert_bbox_to_stl(
     path_to_tiff = _get_tiff_for_bbox(
         bbox_geometry, allow_caching, Path(cache_dir), progress_bar
     )
-    tiff = rio.open(path_to_tiff)
-    elevation_scale = determine_elevation_scale(tiff, model_size)
-    array = tiff_to_array(tiff)
+    with rio.open(path_to_tiff) as tiff:
+        elevation_scale = determine_elevation_scale(tiff, model_size)
+        array = tiff_to_array(tiff)
     if ensure_squared:
         array = cut_array_to_square(array)
 
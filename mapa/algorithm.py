@@ -108,9 +108,9 @@ desired model dimensions.
 4. Write triangles to STL file
 ------------------------------
 
-This is not considered part of the algorithm and is taken care of by `mapa/__init__._save_to_stl_file`. It boils down to
-the usage of numpy-stl, which has a super convenient and efficient interface for writing triangles to a (binary of ascii)
-STL file.
+This is not considered part of the algorithm and is taken care of by `mapa/stl_file.save_to_stl_file`. Binary STL files
+are written by mapping the file into memory and assigning the triangles in one go, while ascii STL files are written
+using numpy-stl.
 """
 
 import logging
@@ -131,35 +131,107 @@ class ModelSize:
     y: float
 
 
-@nb.njit(fastmath=True, cache=True)
 def _create_raster(array: npt.ArrayLike, max_x: int, max_y: int) -> np.ndarray:
     max_x, max_y = array.shape
-    raster = np.zeros((max_x + 1, max_y + 1))
-    # loop over raster elements to determine z value of raster elements
-    for ix in range(0, raster.shape[0]):
-        for iy in range(0, raster.shape[1]):
-            # special treatment of first and last rows/cols
-            if ix >= max_x or iy >= max_y:
-                if ix >= max_x and iy < max_y:
-                    raster[ix][iy] = array[ix - 1][iy]
-                elif iy >= max_y and ix < max_x:
-                    raster[ix][iy] = array[ix][iy - 1]
-                else:
-                    raster[ix][iy] = array[ix - 1][iy - 1]
-            elif ix == 0 or iy == 0:
-                raster[ix][iy] = array[ix][iy]
-            else:
-                # z value in raster is average of four neighbors
-                raster[ix][iy] = (
-                    array[ix][iy]
-                    + array[ix - 1][iy]
-                    + array[ix][iy - 1]
-                    + array[ix - 1][iy - 1]
-                ) / 4
+    raster = np.empty((max_x + 1, max_y + 1))
+    # first row and col take the values of the array, last row and col duplicate the last values of the array
+    raster[0, :-1] = array[0, :]
+    raster[1:-1, 0] = array[1:, 0]
+    raster[-1, :-1] = array[-1, :]
+    raster[:-1, -1] = array[:, -1]
+    raster[-1, -1] = array[-1, -1]
+    # z value of all other raster elements is average of four neighbors
+    if np.issubdtype(array.dtype, np.integer):
+        # avoid overflows when summing up e.g. int16 elevation values
+        array = array.astype(np.int64)
+    raster[1:-1, 1:-1] = (
+        array[1:, 1:] + array[:-1, 1:] + array[1:, :-1] + array[:-1, :-1]
+    ) / 4
     return raster
 
 
-@nb.njit(fastmath=True, cache=True)
+@nb.njit(parallel=True, fastmath=True, cache=True, error_model="numpy")
+def _fill_triangles_of_3d_surface(
+    raster: npt.ArrayLike,
+    array: npt.ArrayLike,
+    max_x: int,
+    max_y: int,
+    x_scale: float,
+    y_scale: float,
+    z_scale: float,
+    z_offset: float,
+    triangles: np.ndarray,
+) -> None:
+    # scale the coordinates of the raster once, instead of once per vertex they are used for
+    xs, ys = np.arange(max_x + 1) * x_scale, np.arange(max_y + 1) * y_scale
+    x_centers, y_centers = (
+        (np.arange(max_x) + 1 / 2) * x_scale,
+        (np.arange(max_y) + 1 / 2) * y_scale,
+    )
+    zs = np.empty(raster.shape, dtype=np.float64)
+    for ix in nb.prange(0, max_x + 1):
+        for iy in range(0, max_y + 1):
+            zs[ix, iy] = raster[ix, iy] * z_scale + z_offset
+
+    # every value of the (max_x, max_y, 4, 3, 3) shaped triangles array gets assigned, thus it does not need to be
+    # initialized. rows are independent of each other and are therefore processed in parallel
+    for ix in nb.prange(0, max_x):
+        x0, x1, xc = xs[ix], xs[ix + 1], x_centers[ix]
+        for iy in range(0, max_y):
+            y0, y1, yc = ys[iy], ys[iy + 1], y_centers[iy]
+            z00, z10, z01, z11 = (
+                zs[ix, iy],
+                zs[ix + 1, iy],
+                zs[ix, iy + 1],
+                zs[ix + 1, iy + 1],
+            )
+            zc = array[ix, iy] * z_scale + z_offset
+
+            # top triangle
+            triangles[ix, iy, 0, 0, 0] = xc
+            triangles[ix, iy, 0, 0, 1] = yc
+            triangles[ix, iy, 0, 0, 2] = zc
+            triangles[ix, iy, 0, 1, 0] = x0
+            triangles[ix, iy, 0, 1, 1] = y0
+            triangles[ix, iy, 0, 1, 2] = z00
+            triangles[ix, iy, 0, 2, 0] = x1
+            triangles[ix, iy, 0, 2, 1] = y0
+            triangles[ix, iy, 0, 2, 2] = z10
+
+            # left triangle
+            triangles[ix, iy, 1, 0, 0] = x0
+            triangles[ix, iy, 1, 0, 1] = y1
+            triangles[ix, iy, 1, 0, 2] = z01
+            triangles[ix, iy, 1, 1, 0] = x0
+            triangles[ix, iy, 1, 1, 1] = y0
+            triangles[ix, iy, 1, 1, 2] = z00
+            triangles[ix, iy, 1, 2, 0] = xc
+            triangles[ix, iy, 1, 2, 1] = yc
+            triangles[ix, iy, 1, 2, 2] = zc
+
+            # bottom triangle
+            triangles[ix, iy, 2, 0, 0] = x1
+            triangles[ix, iy, 2, 0, 1] = y1
+            triangles[ix, iy, 2, 0, 2] = z11
+            triangles[ix, iy, 2, 1, 0] = x0
+            triangles[ix, iy, 2, 1, 1] = y1
+            triangles[ix, iy, 2, 1, 2] = z01
+            triangles[ix, iy, 2, 2, 0] = xc
+            triangles[ix, iy, 2, 2, 1] = yc
+            triangles[ix, iy, 2, 2, 2] = zc
+
+            # right triangle
+            triangles[ix, iy, 3, 0, 0] = xc
+            triangles[ix, iy, 3, 0, 1] = yc
+            triangles[ix, iy, 3, 0, 2] = zc
+            triangles[ix, iy, 3, 1, 0] = x1
+            triangles[ix, iy, 3, 1, 1] = y0
+            triangles[ix, iy, 3, 1, 2] = z10
+            triangles[ix, iy, 3, 2, 0] = x1
+            triangles[ix, iy, 3, 2, 1] = y1
+            triangles[ix, iy, 3, 2, 2] = z11
+
+
 def _compute_triangles_of_3d_surface(
     raster: npt.ArrayLike,
     array: npt.ArrayLike,
@@ -170,73 +242,30 @@ def _compute_triangles_of_3d_surface(
     z_scale: float,
     z_offset: float,
 ) -> np.ndarray:
-    triangles = np.full((max_x, max_y, 4, 3, 3), -1.0, dtype=np.float64)
-    for ix in range(0, max_x):
-        for iy in range(0, max_y):
-            if ix > max_x or iy > max_y:
-                continue
-            else:
-                # top triangle
-                # first vertex
-                triangles[ix, iy, 0, 0, 0] = (ix + 1 / 2) * x_scale
-                triangles[ix, iy, 0, 0, 1] = (iy + 1 / 2) * y_scale
-                triangles[ix, iy, 0, 0, 2] = (array[ix, iy]) * z_scale + z_offset
-                # second vertex
-                triangles[ix, iy, 0, 1, 0] = ix * x_scale
-                triangles[ix, iy, 0, 1, 1] = iy * y_scale
-                triangles[ix, iy, 0, 1, 2] = (raster[ix, iy]) * z_scale + z_offset
-                # third vertex
-                triangles[ix, iy, 0, 2, 0] = (ix + 1) * x_scale
-                triangles[ix, iy, 0, 2, 1] = iy * y_scale
-                triangles[ix, iy, 0, 2, 2] = (raster[ix + 1, iy]) * z_scale + z_offset
-
-                # left triangle
-                # first vertex
-                triangles[ix, iy, 1, 0, 0] = ix * x_scale
-                triangles[ix, iy, 1, 0, 1] = (iy + 1) * y_scale
-                triangles[ix, iy, 1, 0, 2] = (raster[ix, iy + 1]) * z_scale + z_offset
-                # second vertex
-                triangles[ix, iy, 1, 1, 0] = ix * x_scale
-                triangles[ix, iy, 1, 1, 1] = iy * y_scale
-                triangles[ix, iy, 1, 1, 2] = (raster[ix, iy]) * z_scale + z_offset
-                # third vertex
-                triangles[ix, iy, 1, 2, 0] = (ix + 1 / 2) * x_scale
-                triangles[ix, iy, 1, 2, 1] = (iy + 1 / 2) * y_scale
-                triangles[ix, iy, 1, 2, 2] = (array[ix, iy]) * z_scale + z_offset
-
-                # bottom triangle
-                # first vertex
-                triangles[ix, iy, 2, 0, 0] = (ix + 1) * x_scale
-                triangles[ix, iy, 2, 0, 1] = (iy + 1) * y_scale
-                triangles[ix, iy, 2, 0, 2] = (
-                    (raster[ix + 1, iy + 1]) * z_scale + z_offset
-                )
-                # second vertex
-                triangles[ix, iy, 2, 1, 0] = ix * x_scale
-                triangles[ix, iy, 2, 1, 1] = (iy + 1) * y_scale
-                triangles[ix, iy, 2, 1, 2] = (raster[ix, iy + 1]) * z_scale + z_offset
-                # third vertex
-                triangles[ix, iy, 2, 2, 0] = (ix + 1 / 2) * x_scale
-                triangles[ix, iy, 2, 2, 1] = (iy + 1 / 2) * y_scale
-                triangles[ix, iy, 2, 2, 2] = (array[ix, iy]) * z_scale + z_offset
-
-                # right triangle
-                # first vertex
-                triangles[ix, iy, 3, 0, 0] = (ix + 1 / 2) * x_scale
-                triangles[ix, iy, 3, 0, 1] = (iy + 1 / 2) * y_scale
-                triangles[ix, iy, 3, 0, 2] = (array[ix, iy]) * z_scale + z_offset
-                # second vertex
-                triangles[ix, iy, 3, 1, 0] = (ix + 1) * x_scale
-                triangles[ix, iy, 3, 1, 1] = iy * y_scale
-                triangles[ix, iy, 3, 1, 2] = (raster[ix + 1, iy]) * z_scale + z_offset
-                # third vertex
-                triangles[ix, iy, 3, 2, 0] = (ix + 1) * x_scale
-                triangles[ix, iy, 3, 2, 1] = (iy + 1) * y_scale
-                triangles[ix, iy, 3, 2, 2] = (
-                    (raster[ix + 1, iy + 1]) * z_scale + z_offset
-                )
-
-    return triangles.reshape((max_x * max_y * 4, 3, 3))
+    triangles = np.empty((max_x * max_y * 4, 3, 3), dtype=np.float64)
+    _fill_triangles_of_3d_surface(
+        raster,
+        array,
+        max_x,
+        max_y,
+        x_scale,
+        y_scale,
+        z_scale,
+        z_offset,
+        triangles.reshape((max_x, max_y, 4, 3, 3)),
+    )
+    return triangles
+
+
+def _build_triangles(n: int, vertices: tuple) -> np.ndarray:
+    # build n groups of triangles given their (x, y, z) vertices, where each coordinate is a scalar or an array of
+    # length n, i.e. 3 vertices result in n triangles, 6 vertices in n pairs of triangles and so on
+    triangles = np.empty((n, len(vertices), 3), dtype=np.float64)
+    for i, (x, y, z) in enumerate(vertices):
+        triangles[:, i, 0] = x
+        triangles[:, i, 1] = y
+        triangles[:, i, 2] = z
+    return triangles.reshape((n, len(vertices) // 3, 3, 3))
 
 
 def _compute_triangles_of_body_side(
@@ -248,205 +277,150 @@ def _compute_triangles_of_body_side(
     z_scale: float,
     z_offset: float,
 ) -> np.ndarray:
-    # loop over raster and build triangles when in first and last col and row
-    triangles = np.full((max_x * 4 + max_y * 4, 3, 3), -1.0, dtype=np.float64)
-    cnt = 0
+    # each side consists of one pair of triangles per edge cell: one with two points at the top of the mesh and one
+    # with two points at the ground
+    ix, iy = np.arange(max_x), np.arange(max_y)
+    x0, x1, y0, y1 = ix * x_scale, (ix + 1) * x_scale, iy * y_scale, (iy + 1) * y_scale
+    x_max, y_max = max_x * x_scale, max_y * y_scale
+    # only the z values along the edges of the raster are required
+    z_fr, z_lr = raster[0, :] * z_scale + z_offset, raster[-1, :] * z_scale + z_offset
+    z_fc, z_lc = raster[:, 0] * z_scale + z_offset, raster[:, -1] * z_scale + z_offset
 
-    for ix in range(0, max_x):
-        for iy in range(0, max_y):
-            if ix == 0:  # first row
-                # triangle with two points at top of mesh
-                # first vertex
-                triangles[cnt + 0, 0, 0] = 0
-                triangles[cnt + 0, 0, 1] = iy * y_scale
-                triangles[cnt + 0, 0, 2] = raster[ix][iy] * z_scale + z_offset
-                # second vertex
-                triangles[cnt + 0, 1, 0] = 0
-                triangles[cnt + 0, 1, 1] = (iy + 1) * y_scale
-                triangles[cnt + 0, 1, 2] = raster[ix][iy + 1] * z_scale + z_offset
-                # third vertex
-                triangles[cnt + 0, 2, 0] = 0
-                triangles[cnt + 0, 2, 1] = iy * y_scale
-                triangles[cnt + 0, 2, 2] = 0
-                # triangle with two points at ground
-                # first vertex
-                triangles[cnt + 1, 0, 0] = 0
-                triangles[cnt + 1, 0, 1] = iy * y_scale
-                triangles[cnt + 1, 0, 2] = 0
-                # second vertex
-                triangles[cnt + 1, 1, 0] = 0
-                triangles[cnt + 1, 1, 1] = (iy + 1) * y_scale
-                triangles[cnt + 1, 1, 2] = raster[ix][iy + 1] * z_scale + z_offset
-                # third vertex
-                triangles[cnt + 1, 2, 0] = 0
-                triangles[cnt + 1, 2, 1] = (iy + 1) * y_scale
-                triangles[cnt + 1, 2, 2] = 0
-                cnt += 2
-            if ix == max_x - 1:  # last row
-                # two points at top 3d mesh
-                # first vertex
-                triangles[cnt + 0, 0, 0] = max_x * x_scale
-                triangles[cnt + 0, 0, 1] = (iy + 1) * y_scale
-                triangles[cnt + 0, 0, 2] = raster[ix + 1][iy + 1] * z_scale + z_offset
-                # second vertex
-                triangles[cnt + 0, 1, 0] = max_x * x_scale
-                triangles[cnt + 0, 1, 1] = iy * y_scale
-                triangles[cnt + 0, 1, 2] = raster[ix + 1][iy] * z_scale + z_offset
-                # third vertex
-                triangles[cnt + 0, 2, 0] = max_x * x_scale
-                triangles[cnt + 0, 2, 1] = iy * y_scale
-                triangles[cnt + 0, 2, 2] = 0
-                # two points at ground
-                # first vertex
-                triangles[cnt + 1, 0, 0] = max_x * x_scale
-                triangles[cnt + 1, 0, 1] = (iy + 1) * y_scale
-                triangles[cnt + 1, 0, 2] = raster[ix + 1][iy + 1] * z_scale + z_offset
-                # second vertex
-                triangles[cnt + 1, 1, 0] = max_x * x_scale
-                triangles[cnt + 1, 1, 1] = iy * y_scale
-                triangles[cnt + 1, 1, 2] = 0
-                # third vertex
-                triangles[cnt + 1, 2, 0] = max_x * x_scale
-                triangles[cnt + 1, 2, 1] = (iy + 1) * y_scale
-                triangles[cnt + 1, 2, 2] = 0
-                cnt += 2
-            if iy == 0:  # first col
-                # two points at top 3d mesh
-                # first vertex
-                triangles[cnt + 0, 0, 0] = (ix + 1) * x_scale
-                triangles[cnt + 0, 0, 1] = 0
-                triangles[cnt + 0, 0, 2] = raster[ix + 1][iy] * z_scale + z_offset
-                # second vertex
-                triangles[cnt + 0, 1, 0] = ix * x_scale
-                triangles[cnt + 0, 1, 1] = 0
-                triangles[cnt + 0, 1, 2] = raster[ix][iy] * z_scale + z_offset
-                # third vertex
-                triangles[cnt + 0, 2, 0] = ix * x_scale
-                triangles[cnt + 0, 2, 1] = 0
-                triangles[cnt + 0, 2, 2] = 0
-                # two points at ground
-                # first vertex
-                triangles[cnt + 1, 0, 0] = (ix + 1) * x_scale
-                triangles[cnt + 1, 0, 1] = 0
-                triangles[cnt + 1, 0, 2] = raster[ix + 1][iy] * z_scale + z_offset
-                # second vertex
-                triangles[cnt + 1, 1, 0] = ix * x_scale
-                triangles[cnt + 1, 1, 1] = 0
-                triangles[cnt + 1, 1, 2] = 0
-                # third vertex
-                triangles[cnt + 1, 2, 0] = (ix + 1) * x_scale
-                triangles[cnt + 1, 2, 1] = 0
-                triangles[cnt + 1, 2, 2] = 0
-                cnt += 2
-            if iy == max_y - 1:  # last col
-                # two points at top 3d mesh
-                # first vertex
-                triangles[cnt + 0, 0, 0] = ix * x_scale
-                triangles[cnt + 0, 0, 1] = max_y * y_scale
-                triangles[cnt + 0, 0, 2] = raster[ix][iy + 1] * z_scale + z_offset
-                # second vertex
-                triangles[cnt + 0, 1, 0] = (ix + 1) * x_scale
-                triangles[cnt + 0, 1, 1] = max_y * y_scale
-                triangles[cnt + 0, 1, 2] = raster[ix + 1][iy + 1] * z_scale + z_offset
-                # third vertex
-                triangles[cnt + 0, 2, 0] = ix * x_scale
-                triangles[cnt + 0, 2, 1] = max_y * y_scale
-                triangles[cnt + 0, 2, 2] = 0
-                # two points at ground
-                # first vertex
-                triangles[cnt + 1, 0, 0] = ix * x_scale
-                triangles[cnt + 1, 0, 1] = max_y * y_scale
-                triangles[cnt + 1, 0, 2] = 0
-                # second vertex
-                triangles[cnt + 1, 1, 0] = (ix + 1) * x_scale
-                triangles[cnt + 1, 1, 1] = max_y * y_scale
-                triangles[cnt + 1, 1, 2] = raster[ix + 1][iy + 1] * z_scale + z_offset
-                # third vertex
-                triangles[cnt + 1, 2, 0] = (ix + 1) * x_scale
-                triangles[cnt + 1, 2, 1] = max_y * y_scale
-                triangles[cnt + 1, 2, 2] = 0
-                cnt += 2
-    return triangles
+    # first row
+    fr_pairs = _build_triangles(
+        max_y,
+        (
+            (0, y0, z_fr[:-1]),
+            (0, y1, z_fr[1:]),
+            (0, y0, 0),
+            (0, y0, 0),
+            (0, y1, z_fr[1:]),
+            (0, y1, 0),
+        ),
+    )
+    # last row
+    lr_pairs = _build_triangles(
+        max_y,
+        (
+            (x_max, y1, z_lr[1:]),
+            (x_max, y0, z_lr[:-1]),
+            (x_max, y0, 0),
+            (x_max, y1, z_lr[1:]),
+            (x_max, y0, 0),
+            (x_max, y1, 0),
+        ),
+    )
+    # first col
+    fc_pairs = _build_triangles(
+        max_x,
+        (
+            (x1, 0, z_fc[1:]),
+            (x0, 0, z_fc[:-1]),
+            (x0, 0, 0),
+            (x1, 0, z_fc[1:]),
+            (x0, 0, 0),
+            (x1, 0, 0),
+        ),
+    )
+    # last col
+    lc_pairs = _build_triangles(
+        max_x,
+        (
+            (x0, y_max, z_lc[:-1]),
+            (x1, y_max, z_lc[1:]),
+            (x0, y_max, 0),
+            (x0, y_max, 0),
+            (x1, y_max, z_lc[1:]),
+            (x1, y_max, 0),
+        ),
+    )
+
+    # keep the order of walking over the raster cells row by row, where each cell emits the pairs of first row, last
+    # row, first col and last col
+    order = np.concatenate(
+        (
+            iy * 4,
+            ((max_x - 1) * max_y + iy) * 4 + 1,
+            (ix * max_y) * 4 + 2,
+            (ix * max_y + max_y - 1) * 4 + 3,
+        )
+    )
+    position = np.empty(len(order), dtype=np.int64)
+    position[np.argsort(order, kind="stable")] = np.arange(len(order))
+
+    # write the pairs of each side to their final position in the preallocated output array
+    triangles = np.empty((len(order), 2, 3, 3), dtype=np.float64)
+    offset = 0
+    for pairs in (fr_pairs, lr_pairs, fc_pairs, lc_pairs):
+        triangles[position[offset : offset + len(pairs)]] = pairs
+        offset += len(pairs)
+    return triangles.reshape((-1, 3, 3))
 
 
 def _compute_triangles_of_bottom(
     max_x: int, max_y: int, x_scale: float, y_scale: float
 ) -> np.ndarray:
+    x_max, y_max = max_x * x_scale, max_y * y_scale
+
     # first row
-    fr_triangles = np.full((max_x - 1, 3, 3), -1.0, dtype=np.float64)
-    for i, cnt in enumerate(range(0, max_x - 1)):
-        fr_triangles[i, 0, 0] = cnt * x_scale
-        fr_triangles[i, 0, 1] = 0
-        fr_triangles[i, 0, 2] = 0
-        fr_triangles[i, 1, 0] = 0
-        fr_triangles[i, 1, 1] = 1 * y_scale
-        fr_triangles[i, 1, 2] = 0
-        fr_triangles[i, 2, 0] = (cnt + 1) * x_scale
-        fr_triangles[i, 2, 1] = 0
-        fr_triangles[i, 2, 2] = 0
+    cnt = np.arange(0, max_x - 1)
+    fr_triangles = _build_triangles(
+        max_x - 1,
+        ((cnt * x_scale, 0, 0), (0, 1 * y_scale, 0), ((cnt + 1) * x_scale, 0, 0)),
+    )
 
     # first col
-    fc_triangles = np.full((max_y - 1, 3, 3), -1.0, dtype=np.float64)
-    for i, cnt in enumerate(range(1, max_y)):
-        fc_triangles[i, 0, 0] = 0
-        fc_triangles[i, 0, 1] = cnt * y_scale
-        fc_triangles[i, 0, 2] = 0
-        fc_triangles[i, 1, 0] = 0
-        fc_triangles[i, 1, 1] = (cnt + 1) * y_scale
-        fc_triangles[i, 1, 2] = 0
-        fc_triangles[i, 2, 0] = 1 * x_scale
-        fc_triangles[i, 2, 1] = max_y * y_scale
-        fc_triangles[i, 2, 2] = 0
+    cnt = np.arange(1, max_y)
+    fc_triangles = _build_triangles(
+        max_y - 1,
+        ((0, cnt * y_scale, 0), (0, (cnt + 1) * y_scale, 0), (1 * x_scale, y_max, 0)),
+    )
 
     # last row
-    lr_triangles = np.full((max_x - 1, 3, 3), -1.0, dtype=np.float64)
-    for i, cnt in enumerate(range(1, max_x)):
-        lr_triangles[i, 0, 0] = cnt * x_scale
-        lr_triangles[i, 0, 1] = max_y * y_scale
-        lr_triangles[i, 0, 2] = 0
-        lr_triangles[i, 1, 0] = (cnt + 1) * x_scale
-        lr_triangles[i, 1, 1] = max_y * y_scale
-        lr_triangles[i, 1, 2] = 0
-        lr_triangles[i, 2, 0] = max_x * x_scale
-        lr_triangles[i, 2, 1] = (max_y - 1) * y_scale
-        lr_triangles[i, 2, 2] = 0
+    cnt = np.arange(1, max_x)
+    lr_triangles = _build_triangles(
+        max_x - 1,
+        (
+            (cnt * x_scale, y_max, 0),
+            ((cnt + 1) * x_scale, y_max, 0),
+            (x_max, (max_y - 1) * y_scale, 0),
+        ),
+    )
 
     # last col
-    lc_triangles = np.full((max_y - 1, 3, 3), -1.0, dtype=np.float64)
-    for i, cnt in enumerate(range(0, max_y - 1)):
-        lc_triangles[i, 0, 0] = max_x * x_scale
-        lc_triangles[i, 0, 1] = cnt * y_scale
-        lc_triangles[i, 0, 2] = 0
-        lc_triangles[i, 1, 0] = (max_x - 1) * x_scale
-        lc_triangles[i, 1, 1] = 0
-        lc_triangles[i, 1, 2] = 0
-        lc_triangles[i, 2, 0] = max_x * x_scale
-        lc_triangles[i, 2, 1] = (cnt + 1) * y_scale
-        lc_triangles[i, 2, 2] = 0
-
-    center_triangles = np.full((2, 3, 3), -1.0, dtype=np.float64)
-    center_triangles[0, 0, 0] = (max_x - 1) * x_scale
-    center_triangles[0, 0, 1] = 0 * y_scale
-    center_triangles[0, 0, 2] = 0
-    center_triangles[0, 1, 0] = 1 * x_scale
-    center_triangles[0, 1, 1] = max_y * y_scale
-    center_triangles[0, 1, 2] = 0
-    center_triangles[0, 2, 0] = max_x * x_scale
-    center_triangles[0, 2, 1] = (max_y - 1) * y_scale
-    center_triangles[0, 2, 2] = 0
-
-    center_triangles[1, 0, 0] = 1 * x_scale
-    center_triangles[1, 0, 1] = max_y * y_scale
-    center_triangles[1, 0, 2] = 0
-    center_triangles[1, 1, 0] = (max_x - 1) * x_scale
-    center_triangles[1, 1, 1] = 0 * y_scale
-    center_triangles[1, 1, 2] = 0
-    center_triangles[1, 2, 0] = 0 * x_scale
-    center_triangles[1, 2, 1] = 1 * y_scale
-    center_triangles[1, 2, 2] = 0
-
-    return np.vstack(
-        (fr_triangles, lr_triangles, fc_triangles, lc_triangles, center_triangles)
+    cnt = np.arange(0, max_y - 1)
+    lc_triangles = _build_triangles(
+        max_y - 1,
+        (
+            (x_max, cnt * y_scale, 0),
+            ((max_x - 1) * x_scale, 0, 0),
+            (x_max, (cnt + 1) * y_scale, 0),
+        ),
+    )
+
+    center_triangles = _build_triangles(
+        1,
+        (
+            ((max_x - 1) * x_scale, 0 * y_scale, 0),
+            (1 * x_scale, y_max, 0),
+            (x_max, (max_y - 1) * y_scale, 0),
+            (1 * x_scale, y_max, 0),
+            ((max_x - 1) * x_scale, 0 * y_scale, 0),
+            (0 * x_scale, 1 * y_scale, 0),
+        ),
+    )
+
+    return np.concatenate(
+        [
+            triangles.reshape((-1, 3, 3))
+            for triangles in (
+                fr_triangles,
+                lr_triangles,
+                fc_triangles,
+                lc_triangles,
+                center_triangles,
+            )
+        ]
     )
 
 
@@ -471,6 +445,7 @@ def compute_all_triangles(
     z_offset: Union[None, float],
     z_scale: float,
     elevation_scale: float,
+    dtype: npt.DTypeLike = np.float64,
 ) -> np.ndarray:
     max_x, max_y = array.shape
 
@@ -482,17 +457,6 @@ def compute_all_triangles(
     combined_z_scale = elevation_scale * z_scale
 
     # compute triangles for 3d surface, sides and bottom
-    log.debug("⛰  computing triangles of 3d surface...")
-    dem_triangles = _compute_triangles_of_3d_surface(
-        raster=raster,
-        array=array,
-        max_x=max_x,
-        max_y=max_y,
-        x_scale=x_scale,
-        y_scale=y_scale,
-        z_scale=combined_z_scale,
-        z_offset=z_offset,
-    )
     log.debug("📐  computing triangles of body sides...")
     side_triangles = _compute_triangles_of_body_side(
         raster=raster,
@@ -506,7 +470,29 @@ def compute_all_triangles(
     bottom_triangles = _compute_triangles_of_bottom(
         max_x=max_x, max_y=max_y, x_scale=x_scale, y_scale=y_scale
     )
-    return np.vstack((dem_triangles, side_triangles, bottom_triangles))
+
+    # the triangles of the 3d surface make up the largest part of the output, thus they are written directly into
+    # the final array instead of being copied into it afterwards
+    n_surface, n_side = max_x * max_y * 4, len(side_triangles)
+    # note, all values are computed with double precision and only rounded when being stored, e.g. as float32
+    triangles = np.empty(
+        (n_surface + n_side + len(bottom_triangles), 3, 3), dtype=dtype
+    )
+    log.debug("⛰  computing triangles of 3d surface...")
+    _fill_triangles_of_3d_surface(
+        raster,
+        array,
+        max_x,
+        max_y,
+        x_scale,
+        y_scale,
+        combined_z_scale,
+        z_offset,
+        triangles[:n_surface].reshape((max_x, max_y, 4, 3, 3)),
+    )
+    triangles[n_surface : n_surface + n_side] = side_triangles
+    triangles[n_surface + n_side :] = bottom_triangles
+    return triangles
 
 
 def reduce_resolution(array: npt.ArrayLike, bin_factor: int) -> np.ndarray:
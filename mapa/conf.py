@@ -15,3 +15,5 @@ DEMO_TIFF_PATH = Path(__file__).parent.parent / "tests" / "tiff" / "hawaii.tiff"
 # stac catalogue
 PLANETARY_COMPUTER_API_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
 PLANETARY_COMPUTER_COLLECTION = "alos-dem"
+STAC_SEARCH_CACHE_EXPIRY_IN_SECONDS = 24 * 60 * 60
+MAX_DOWNLOAD_WORKERS = 4
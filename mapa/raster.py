@@ -1,15 +1,14 @@
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
 import rasterio as rio
 from haversine import haversine
-from rasterio.io import DatasetReader
+from rasterio.io import DatasetReader, MemoryFile
 from rasterio.mask import mask
 from rasterio.merge import merge
-from rasterio.windows import Window
 
 from mapa.utils import path_to_clipped_tiff, path_to_merged_tiff
 
@@ -17,21 +16,28 @@ log = logging.getLogger(__name__)
 
 
 def clip_tiff_to_bbox(
-    input_tiff: Path, bbox_geometry: dict, bbox_hash: str, cache_dir: Path
+    input_tiff: Union[Path, MemoryFile],
+    bbox_geometry: dict,
+    bbox_hash: str,
+    cache_dir: Path,
 ) -> Path:
     log.debug("🔪  clipping region of interest...")
-    data = rio.open(input_tiff)
-    out_img, out_transform = mask(data, shapes=[bbox_geometry], crop=True)
-    out_meta = data.meta.copy()
-    out_meta.update(
-        {
-            "driver": "GTiff",
-            "height": out_img.shape[1],
-            "width": out_img.shape[2],
-            "transform": out_transform,
-            "crs": data.crs,
-        }
-    )
+    if isinstance(input_tiff, MemoryFile):
+        dataset = input_tiff.open()
+    else:
+        dataset = rio.open(input_tiff)
+    with dataset as data:
+        out_img, out_transform = mask(data, shapes=[bbox_geometry], crop=True)
+        out_meta = data.meta.copy()
+        out_meta.update(
+            {
+                "driver": "GTiff",
+                "height": out_img.shape[1],
+                "width": out_img.shape[2],
+                "transform": out_transform,
+                "crs": data.crs,
+            }
+        )
     clipped_tiff = path_to_clipped_tiff(bbox_hash, cache_dir)
     with rio.open(clipped_tiff, "w", **out_meta) as file:
         file.write(out_img)
@@ -39,23 +45,23 @@ def clip_tiff_to_bbox(
 
 
 def tiff_to_array(tiff: DatasetReader) -> np.ndarray:
-    array = tiff.read()
-    # drop higher dimension to get 2-dimensional (x * y) array
-    return array[0, :, :]
+    # only read the first band to directly get a 2-dimensional (x * y) array
+    return tiff.read(1)
 
 
 def remove_empty_first_and_last_rows_and_cols(array: npt.ArrayLike) -> np.ndarray:
+    # slicing returns views of the array, i.e. in contrast to np.delete no data needs to be copied
     # remove first and last cols in case of all zero
     if not array[:, 0].any():
-        array = np.delete(array, (0), axis=1)
+        array = array[:, 1:]
     if not array[:, -1].any():
-        array = np.delete(array, (-1), axis=1)
+        array = array[:, :-1]
 
     # remove first and last rows in case of all zero
     if not array[0].any():
-        array = np.delete(array, (0), axis=0)
+        array = array[1:]
     if not array[-1].any():
-        array = np.delete(array, (-1), axis=0)
+        array = array[:-1]
 
     return array
 
@@ -74,17 +80,15 @@ def cut_array_to_square(array: npt.ArrayLike) -> np.ndarray:
 
 
 def _get_coordinate_of_pixel(row: int, col: int, tiff: DatasetReader) -> Tuple[float]:
-    meta = tiff.meta
-    window = Window(0, 0, meta["width"], meta["height"])
-    meta["transform"] = rio.windows.transform(window, tiff.transform)
-    x, y = rio.transform.xy(meta["transform"], row, col, offset="center")
+    # a window covering the full raster has the same transform as the dataset, thus use it directly
+    x, y = rio.transform.xy(tiff.transform, row, col, offset="center")
     # swap lat and lon because that is the order expected by haversine
     return (y, x)
 
 
 def determine_elevation_scale(tiff: DatasetReader, model_size: int) -> float:
-    array = tiff.read()[0, :, :]
-    _, cols = array.shape
+    # the number of cols is known from the metadata, thus there is no need to read the raster data
+    cols = tiff.width
 
     # get lat lon coordinate of top left and top right pixel
     top_left_coor = _get_coordinate_of_pixel(0, 0, tiff)
@@ -97,7 +101,7 @@ def determine_elevation_scale(tiff: DatasetReader, model_size: int) -> float:
     return one_meter_in_model
 
 
-def merge_tiffs(tiffs: List[Path], bbox_hash: str, cache_dir: Path) -> Path:
+def _merge_tiffs(tiffs: List[Path]) -> Tuple[np.ndarray, dict]:
     datasets = []
     for tiff in tiffs:
         data = rio.open(tiff)
@@ -113,7 +117,23 @@ def merge_tiffs(tiffs: List[Path], bbox_hash: str, cache_dir: Path) -> Path:
             "crs": data.crs,
         }
     )
+    for data in datasets:
+        data.close()
+    return mosaic, out_meta
+
+
+def merge_tiffs(tiffs: List[Path], bbox_hash: str, cache_dir: Path) -> Path:
+    mosaic, out_meta = _merge_tiffs(tiffs)
     tiff = path_to_merged_tiff(bbox_hash, cache_dir)
     with rio.open(tiff, "w", **out_meta) as dest:
         dest.write(mosaic)
     return tiff
+
+
+def merge_tiffs_in_memory(tiffs: List[Path]) -> MemoryFile:
+    # keeps the merged tiff in memory, i.e. saves writing and reading it from disk, in case it does not get cached
+    mosaic, out_meta = _merge_tiffs(tiffs)
+    memfile = MemoryFile()
+    with memfile.open(**out_meta) as dest:
+        dest.write(mosaic)
+    return memfile
@@ -1,16 +1,22 @@
+import json
 import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Union
+from typing import Iterator, List, Tuple, Union
 from urllib import request
 
 import geojson
-from pystac.item import Item
 from pystac_client import Client
-from planetary_computer import sign_inplace
+from planetary_computer import sign_url
 
 from mapa import conf
+from mapa.caching import get_hash_of_geojson
 from mapa.exceptions import NoSTACItemFound
-from mapa.utils import ProgressBar
+from mapa.utils import ProgressBar, path_to_stac_items
 
 log = logging.getLogger(__name__)
 
@@ -34,15 +40,79 @@ def _turn_geojson_into_bbox(geojson_bbox: dict) -> List[float]:
 
 
 def _get_tiff_file(
-    stac_item: Item, allow_caching: bool, cache_dir: Path, count: int, max: int
+    item_id: str, href: str, allow_caching: bool, cache_dir: Path, count: int
 ) -> Path:
-    tiff = cache_dir / f"{stac_item.id}.tiff"
-    if tiff.is_file() and allow_caching:
-        log.info(f"🚀  {count}/{max} using cached stac item {stac_item.id}")
+    tiff = cache_dir / f"{item_id}.tiff"
+    # the marker is written after a download succeeded, i.e. interrupted or failed downloads are not reused
+    marker = tiff.with_suffix(".ok")
+    if (
+        allow_caching
+        and marker.is_file()
+        and tiff.is_file()
+        and tiff.stat().st_size > 0
+    ):
+        log.info(f"🚀  {count}. using cached stac item {item_id}")
         return tiff
     else:
-        log.info(f"🏞  {count}/{max} downloading stac item {stac_item.id}")
-        return _download_file(stac_item.assets["data"].href, tiff)
+        log.info(f"🏞  {count}. downloading stac item {item_id}")
+        marker.unlink(missing_ok=True)
+        tiff = _download_file(sign_url(href), tiff)
+        marker.touch()
+        return tiff
+
+
+@lru_cache(maxsize=1)
+def _open_client() -> Client:
+    return Client.open(conf.PLANETARY_COMPUTER_API_URL, ignore_conformance=True)
+
+
+def _search_stac_items(
+    bbox: List[float], allow_caching: bool, cache_dir: Path
+) -> Iterator[Tuple[str, str]]:
+    # round coordinates to avoid cache misses caused by floating point noise of the drawn bounding box
+    key = get_hash_of_geojson(
+        {
+            "collection": conf.PLANETARY_COMPUTER_COLLECTION,
+            "bbox": [round(c, 5) for c in bbox],
+        }
+    )
+    cached_items = path_to_stac_items(key, cache_dir)
+    if (
+        allow_caching
+        and cached_items.is_file()
+        and time.time() - cached_items.stat().st_mtime
+        < conf.STAC_SEARCH_CACHE_EXPIRY_IN_SECONDS
+    ):
+        log.debug("🚀  using cached stac search results")
+        for item_id, href in json.loads(cached_items.read_text()):
+            yield item_id, href
+        return
+
+    # the hrefs are stored unsigned, since the signature expires, they get signed right before downloading
+    search = _open_client().search(
+        collections=[conf.PLANETARY_COMPUTER_COLLECTION], bbox=bbox
+    )
+    items = []
+    # yield items page by page, so that consumers can process them while further pages are requested
+    for item in search.items():
+        items.append((item.id, item.assets["data"].href))
+        yield items[-1]
+    if items and allow_caching:
+        _write_stac_items(items, cached_items)
+
+
+def _write_stac_items(items: List[Tuple[str, str]], cached_items: Path) -> None:
+    # write to a unique temporary file first and rename it afterwards, so that concurrent runs (e.g. multiple
+    # streamlit sessions, which are threads of the same process) or interrupted runs never read a partially
+    # written cache file
+    fd, tmp = tempfile.mkstemp(dir=cached_items.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(items, f)
+        os.replace(tmp, cached_items)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 def fetch_stac_items_for_bbox(
@@ -52,25 +122,28 @@ def fetch_stac_items_for_bbox(
     progress_bar: Union[None, ProgressBar] = None,
 ) -> List[Path]:
     bbox = _turn_geojson_into_bbox(geojson)
-    client = Client.open(
-        conf.PLANETARY_COMPUTER_API_URL,
-        ignore_conformance=True,
-        modifier=sign_inplace,
-    )
-    search = client.search(collections=[conf.PLANETARY_COMPUTER_COLLECTION], bbox=bbox)
-    items = list(search.items())
-    n = len(items)
-    if progress_bar:
-        progress_bar.steps += n
-    if n > 0:
+    with ThreadPoolExecutor(max_workers=conf.MAX_DOWNLOAD_WORKERS) as executor:
+        # downloads start as soon as an item is found, while the search continues with the next page
+        futures = []
+        for cnt, (item_id, href) in enumerate(
+            _search_stac_items(bbox, allow_caching, cache_dir)
+        ):
+            futures.append(
+                executor.submit(
+                    _get_tiff_file, item_id, href, allow_caching, cache_dir, cnt + 1
+                )
+            )
+            if progress_bar:
+                progress_bar.steps += 1
+        n = len(futures)
+        if n == 0:
+            raise NoSTACItemFound(
+                "Could not find the desired STAC item for the given bounding box."
+            )
         log.info(f"⬇️  fetching {n} stac items...")
         files = []
-        for cnt, item in enumerate(items):
-            files.append(_get_tiff_file(item, allow_caching, cache_dir, cnt + 1, n))
+        for future in futures:
+            files.append(future.result())
             if progress_bar:
                 progress_bar.step()
         return files
-    else:
-        raise NoSTACItemFound(
-            "Could not find the desired STAC item for the given bounding box."
-        )
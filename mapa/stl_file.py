@@ -1,44 +1,103 @@
+import struct
 from pathlib import Path
 from typing import Tuple
 
+import numba as nb
 import numpy as np
-from stl import Dimension, Mode, mesh
+from stl import Mode, mesh
+
+# layout of a binary stl file: 80 bytes header, uint32 number of triangles, followed by one 50 bytes record per triangle
+STL_HEADER_SIZE = 84
+STL_DTYPE = np.dtype(
+    [("normals", "<f4", (3,)), ("vectors", "<f4", (3, 3)), ("attr", "<u2", (1,))]
+)
+# below this number of triangles, numpy is fast enough and the parallel numba kernel would not pay off
+PARALLEL_STL_WRITE_THRESHOLD = 100_000
+
+
+def _compute_normals(triangles: np.ndarray) -> np.ndarray:
+    normals = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    # degenerated triangles (i.e. without area) keep a zero normal
+    return np.divide(normals, length, out=normals, where=length > 0)
+
+
+@nb.njit(parallel=True, fastmath=True, cache=True, error_model="numpy")
+def _fill_stl_records(
+    triangles: np.ndarray, normals: np.ndarray, vectors: np.ndarray
+) -> None:
+    # compute the normal and copy the vertices of each triangle in a single pass
+    for i in nb.prange(triangles.shape[0]):
+        ux = triangles[i, 1, 0] - triangles[i, 0, 0]
+        uy = triangles[i, 1, 1] - triangles[i, 0, 1]
+        uz = triangles[i, 1, 2] - triangles[i, 0, 2]
+        vx = triangles[i, 2, 0] - triangles[i, 0, 0]
+        vy = triangles[i, 2, 1] - triangles[i, 0, 1]
+        vz = triangles[i, 2, 2] - triangles[i, 0, 2]
+        nx = uy * vz - uz * vy
+        ny = uz * vx - ux * vz
+        nz = ux * vy - uy * vx
+        length = np.sqrt(nx * nx + ny * ny + nz * nz)
+        if length > 0:
+            nx, ny, nz = nx / length, ny / length, nz / length
+        normals[i, 0] = nx
+        normals[i, 1] = ny
+        normals[i, 2] = nz
+        for j in range(3):
+            for k in range(3):
+                vectors[i, j, k] = triangles[i, j, k]
+
+
+def _save_to_binary_stl_file(triangles: np.ndarray, output_file: str) -> None:
+    n = triangles.shape[0]
+    header = f"mapa {Path(output_file).name}".encode()[:80].ljust(80, b" ")
+    with open(output_file, "w+b") as f:
+        f.write(header)
+        f.write(struct.pack("<I", n))
+        f.truncate(STL_HEADER_SIZE + n * STL_DTYPE.itemsize)
+        # write the triangle records directly into the file, skipping the intermediate copy numpy-stl would create
+        records = np.memmap(
+            f, dtype=STL_DTYPE, mode="r+", offset=STL_HEADER_SIZE, shape=(n,)
+        )
+        if n > PARALLEL_STL_WRITE_THRESHOLD:
+            _fill_stl_records(triangles, records["normals"], records["vectors"])
+        else:
+            records["normals"] = _compute_normals(triangles)
+            records["vectors"] = triangles
+        records.flush()
+        del records
 
 
 def save_to_stl_file(triangles: np.ndarray, output_file: str, as_ascii: bool) -> str:
-    stl = mesh.Mesh(np.zeros(triangles.shape[0], dtype=mesh.Mesh.dtype))
-    stl.vectors = triangles
     if as_ascii:
+        stl = mesh.Mesh(np.zeros(triangles.shape[0], dtype=mesh.Mesh.dtype))
+        stl.vectors = triangles
         stl.save(output_file, mode=Mode.ASCII)
     else:
-        stl.save(output_file, mode=Mode.BINARY)
+        _save_to_binary_stl_file(triangles, output_file)
     return output_file
 
 
-def _find_dimensions_of_mesh(mesh_obj) -> Tuple[float]:
-    minx = maxx = miny = maxy = minz = maxz = None
-    for p in mesh_obj.points:
-        if minx is None:
-            minx = p[Dimension.X]
-            maxx = p[Dimension.X]
-            miny = p[Dimension.Y]
-            maxy = p[Dimension.Y]
-            minz = p[Dimension.Z]
-            maxz = p[Dimension.Z]
-        else:
-            maxx = max(p[Dimension.X], maxx)
-            minx = min(p[Dimension.X], minx)
-            maxy = max(p[Dimension.Y], maxy)
-            miny = min(p[Dimension.Y], miny)
-            maxz = max(p[Dimension.Z], maxz)
-            minz = min(p[Dimension.Z], minz)
-    x = maxx - minx
-    y = maxy - miny
-    z = maxz - minz
+def _find_dimensions_of_vectors(vectors: np.ndarray) -> Tuple[float]:
+    x, y, z = vectors.max(axis=(0, 1)) - vectors.min(axis=(0, 1))
     return x, y, z
 
 
 def get_dimensions_of_stl_file(stl_path: Path) -> Tuple[float]:
     assert Path(stl_path).suffix == ".stl", "can compute dimensions of stl files only!"
+    with open(stl_path, "rb") as f:
+        f.seek(80)
+        n = struct.unpack("<I", f.read(4))[0]
+        is_binary = (
+            Path(stl_path).stat().st_size == STL_HEADER_SIZE + n * STL_DTYPE.itemsize
+        )
+        if is_binary and n > 0:
+            # only map the records of the binary stl file into memory instead of parsing the whole mesh
+            records = np.memmap(
+                f, dtype=STL_DTYPE, mode="r", offset=STL_HEADER_SIZE, shape=(n,)
+            )
+            return _find_dimensions_of_vectors(records["vectors"])
     main_body = mesh.Mesh.from_file(stl_path)
-    return _find_dimensions_of_mesh(main_body)
+    return _find_dimensions_of_vectors(main_body.vectors)
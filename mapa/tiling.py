@@ -1,8 +1,11 @@
+import re
 from dataclasses import dataclass
 from typing import List
 
 import numpy as np
 
+TILES_FORMAT_PATTERN = re.compile(r"([1-9]\d*)x([1-9]\d*)")
+
 
 @dataclass
 class TileFormat:
@@ -26,19 +29,10 @@ def split_array_into_tiles(
 
 
 def get_x_y_from_tiles_format(tiles_format: str) -> TileFormat:
-    error_msg = (
-        "Invalid format of `split_area_in_tiles`. Input value needs to be of format `nxm`, where `n` and `m` "
-        "are integers greater than zero."
-    )
-    if "x" not in tiles_format:
-        raise ValueError(error_msg)
-
-    format_list = tiles_format.split("x")
-
-    if "0" in format_list:
-        raise ValueError(error_msg)
-
-    if len(format_list) != 2:
-        raise ValueError(error_msg)
-
-    return TileFormat(x=int(format_list[0]), y=int(format_list[1]))
+    match = TILES_FORMAT_PATTERN.fullmatch(tiles_format)
+    if match is None:
+        raise ValueError(
+            "Invalid format of `split_area_in_tiles`. Input value needs to be of format `nxm`, where `n` and `m` "
+            "are integers greater than zero."
+        )
+    return TileFormat(x=int(match[1]), y=int(match[2]))
@@ -1,7 +1,9 @@
 import hashlib
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Union
 
 log = logging.getLogger(__name__)
 
@@ -21,22 +23,41 @@ def path_to_clipped_tiff(bbox_hash: str, cache_dir: Path) -> Path:
     return cache_dir / f"clipped_{bbox_hash}.tiff"
 
 
+def path_to_stac_items(search_hash: str, cache_dir: Path) -> Path:
+    return cache_dir / f"stac_items_{search_hash}.json"
+
+
 def md5_sum(path: Path) -> str:
     hash_md5 = hashlib.md5()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
+    # same approach as hashlib.file_digest (python >= 3.11): read into a single reusable buffer instead of allocating
+    # a new bytes object per chunk, hashlib releases the GIL for large chunks, which allows hashing files in threads
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            hash_md5.update(view[:size])
     return hash_md5.hexdigest()
 
 
+def md5_sums(paths: List[Path]) -> Dict[Path, str]:
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return dict(zip(paths, executor.map(md5_sum, paths)))
+
+
 class ProgressBar:
     def __init__(self, progress_bar: object, steps: int = 0) -> None:
         self.progress_bar = progress_bar  # streamlit st.progress_bar object
         self.steps: int = steps
         self.counter: int = 0
+        self._last_progress: Union[None, int] = None
 
     def step(self) -> None:
-        progress = 100 // (self.steps - 1) * (self.counter + 1)
-        progress = progress if progress <= 100 else 100
-        self.progress_bar.progress(progress)
         self.counter += 1
+        # note, steps might be increased after initialization, e.g. once the number of stac items is known
+        progress = min(self.counter * 100 // max(self.steps, 1), 100)
+        # only update the progress bar in case the percentage changed, since each update is sent to the frontend
+        if progress != self._last_progress:
+            self.progress_bar.progress(progress)
+            self._last_progress = progress
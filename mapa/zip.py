@@ -1,20 +1,31 @@
 import logging
 import zipfile
 from pathlib import Path
-from typing import List, Union
+from typing import List, Literal, Union
 
 from mapa.utils import ProgressBar
 
 log = logging.getLogger(__name__)
 
+# "store" only bundles the files without compressing them, which is by far the fastest option but won't reduce the
+# file size, while "deflate" reduces the size of typical stl files by a factor of ~4
+COMPRESSION_METHODS = {"store": zipfile.ZIP_STORED, "deflate": zipfile.ZIP_DEFLATED}
+
 
 def create_zip_archive(
     files: List[Path],
     output_file: Union[str, Path],
     progress_bar: Union[ProgressBar, None] = None,
+    compression: Literal["store", "deflate"] = "deflate",
 ) -> Path:
+    if compression not in COMPRESSION_METHODS:
+        raise ValueError(
+            f"Invalid compression '{compression}', supported are: {list(COMPRESSION_METHODS)}"
+        )
     log.info(f"📦  compressing stl files: {[f.name for f in files]}")
-    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zip_file:
+    with zipfile.ZipFile(
+        output_file, "w", COMPRESSION_METHODS[compression]
+    ) as zip_file:
         for f in files:
             zip_file.write(f, f.name)
             if progress_bar:
@@ -3,6 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
+import mapa
 from mapa import conf, stac
 
 
@@ -121,3 +122,12 @@ def mock_file_download(monkeypatch, test_tiff):
 @pytest.fixture
 def mock_max_res(monkeypatch):
     monkeypatch.setattr(conf, "MAXIMUM_RESOLUTION", 10)
+
+
+@pytest.fixture
+def mock_tiff_for_bbox(monkeypatch, test_tiff):
+    # Use this fixture in tests, which only verify the dimensions of the output, to skip fetching and clipping tiffs
+    def _mocked_get_tiff_for_bbox(*args, **kwargs) -> Path:
+        return test_tiff
+
+    monkeypatch.setattr(mapa, "_get_tiff_for_bbox", _mocked_get_tiff_for_bbox)
@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 import pytest
 
@@ -26,17 +24,23 @@ def test_create_raster() -> None:
     res = _create_raster(two_by_two, max_x, max_y)
     assert res.shape == (3, 3)
 
-    assert res[0, 0] == two_by_two[0, 0]
-    assert res[0, 1] == two_by_two[0, 1]
-    assert res[1, 0] == two_by_two[1, 0]
-    assert res[2, 0] == two_by_two[1, 0]
-    assert res[0, 2] == two_by_two[0, 1]
-    assert res[2, 2] == two_by_two[1, 1]
-    assert res[1, 2] == two_by_two[1, 1]
-    assert res[2, 1] == two_by_two[1, 1]
+    # first row and col equal the array, last row and col duplicate it, the center is the mean of all four values
+    expected = np.array(
+        [
+            [two_by_two[0, 0], two_by_two[0, 1], two_by_two[0, 1]],
+            [two_by_two[1, 0], two_by_two.mean(), two_by_two[1, 1]],
+            [two_by_two[1, 0], two_by_two[1, 1], two_by_two[1, 1]],
+        ]
+    )
+    border = np.ones(res.shape, dtype=bool)
+    border[1, 1] = False
+    np.testing.assert_array_equal(expected[border], res[border])
+    np.testing.assert_allclose(expected[1, 1], res[1, 1])
 
-    assert round(res[1, 1], 5) == round(two_by_two.mean(), 5)
-    assert math.isclose(res[1, 1], two_by_two.mean())
+    # summing up the neighbors must not overflow for integer arrays
+    int_array = np.full((2, 2), 20000, dtype=np.int16)
+    res = _create_raster(int_array, 2, 2)
+    assert res[1, 1] == 20000
 
 
 def test_compute_triangles_of_3d_surface() -> None:
@@ -214,6 +218,17 @@ def test_compute_all_triangles__min_occurrences() -> None:
     assert min(occurrences) >= 4
 
 
+def test_compute_all_triangles__dtype(input_array) -> None:
+    kwargs = dict(
+        desired_size=ModelSize(200, 150), z_offset=1.0, z_scale=2.0, elevation_scale=0.1
+    )
+    triangles_64 = compute_all_triangles(input_array, **kwargs)
+    triangles_32 = compute_all_triangles(input_array, **kwargs, dtype=np.float32)
+    assert triangles_64.dtype == np.float64
+    assert triangles_32.dtype == np.float32
+    np.testing.assert_array_equal(triangles_64.astype(np.float32), triangles_32)
+
+
 def test__compute_triangles_of_bottom() -> None:
     array = np.array(
         [
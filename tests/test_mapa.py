@@ -1,11 +1,14 @@
 import math
 import time
+from functools import partial
 from pathlib import Path
 from zipfile import ZipFile
 
+import numpy as np
 import pytest
 import rasterio as rio
 
+import mapa
 from mapa import (
     _fetch_merge_and_clip_tiffs,
     _get_tiff_for_bbox,
@@ -15,8 +18,10 @@ from mapa import (
 from mapa.stac import _turn_geojson_into_bbox
 from mapa.stl_file import get_dimensions_of_stl_file
 from mapa.utils import TMPDIR, path_to_clipped_tiff, path_to_merged_tiff
+from mapa.zip import create_zip_archive
 
 
+@pytest.mark.stac
 def test_create_stl_for_bbox__success(output_file, hawaii_bbox) -> None:
     output_file = convert_bbox_to_stl(
         bbox_geometry=hawaii_bbox,
@@ -28,7 +33,8 @@ def test_create_stl_for_bbox__success(output_file, hawaii_bbox) -> None:
     # assert mesh.Mesh.from_file(output_file).is_closed()   # TODO
 
 
-def test_create_stl_for_bbox__z_scale_from_geotiff(hawaii_bbox, output_file):
+@pytest.mark.stac
+def test_create_stl_for_bbox__z_scale_from_geotiff(hawaii_bbox, output_file, tmp_path):
     output = convert_bbox_to_stl(
         bbox_geometry=hawaii_bbox,
         as_ascii=False,
@@ -39,6 +45,7 @@ def test_create_stl_for_bbox__z_scale_from_geotiff(hawaii_bbox, output_file):
         z_scale=0.3,
         ensure_squared=True,
         compress=False,
+        cache_dir=tmp_path,
         allow_caching=False,
     )
     x, y, z = get_dimensions_of_stl_file(output)
@@ -46,7 +53,7 @@ def test_create_stl_for_bbox__z_scale_from_geotiff(hawaii_bbox, output_file):
     assert y == 200.0
     assert math.isclose(z, 87.96, rel_tol=0.1)
 
-    # again get dimensions of a model with 10 instead of 5mm z-offset
+    # again get dimensions of a model with 10 instead of 5mm z-offset, the tiff fetched above can be reused
     z_5 = z
     output = convert_bbox_to_stl(
         bbox_geometry=hawaii_bbox,
@@ -58,7 +65,8 @@ def test_create_stl_for_bbox__z_scale_from_geotiff(hawaii_bbox, output_file):
         z_scale=0.3,
         ensure_squared=True,
         compress=False,
-        allow_caching=False,
+        cache_dir=tmp_path,
+        allow_caching=True,
     )
     x, y, z_10 = get_dimensions_of_stl_file(output)
     assert x == 200.0
@@ -67,6 +75,7 @@ def test_create_stl_for_bbox__z_scale_from_geotiff(hawaii_bbox, output_file):
     assert z_5 + 5 == z_10
 
 
+@pytest.mark.usefixtures("mock_tiff_for_bbox")
 def test_convert_bbox_to_stl__verify_x_y_dimensions(output_file, hawaii_bbox) -> None:
     size = 200
     path = convert_bbox_to_stl(
@@ -75,7 +84,7 @@ def test_convert_bbox_to_stl__verify_x_y_dimensions(output_file, hawaii_bbox) ->
         z_offset=None,
         output_file=output_file,
         ensure_squared=True,  # format ratio should equal a square
-        allow_caching=False,
+        allow_caching=True,
         compress=False,
     )
 
@@ -83,11 +92,13 @@ def test_convert_bbox_to_stl__verify_x_y_dimensions(output_file, hawaii_bbox) ->
     assert x == y == size
 
 
+@pytest.mark.stac
 def test__get_tiff_for_bbox(hawaii_bbox) -> None:
     tiff = _get_tiff_for_bbox(hawaii_bbox, allow_caching=False, cache_dir=TMPDIR())
     assert tiff.is_file()
 
 
+@pytest.mark.stac
 def test__fetch_merge_and_clip_tiffs(geojson_bbox_two_stac_items) -> None:
     cache_dir = TMPDIR()
     bbox_hash = caching.get_hash_of_geojson(geojson_bbox_two_stac_items)
@@ -102,15 +113,18 @@ def test__fetch_merge_and_clip_tiffs(geojson_bbox_two_stac_items) -> None:
     # verify coordinates of resulting tiff is in line with the coordinates of the input bbox
     bbox = _turn_geojson_into_bbox(geojson_bbox_two_stac_items)
     left, bottom, right, top = bbox[0], bbox[1], bbox[2], bbox[3]
-    data = rio.open(tiff)
-    assert math.isclose(data.bounds.left, left, rel_tol=0.0001)
-    assert math.isclose(data.bounds.bottom, bottom, rel_tol=0.0001)
-    assert math.isclose(data.bounds.right, right, rel_tol=0.0001)
-    assert math.isclose(data.bounds.top, top, rel_tol=0.0001)
+    with rio.open(tiff) as data:
+        bounds = data.bounds
+    np.testing.assert_allclose(
+        [bounds.left, bounds.bottom, bounds.right, bounds.top],
+        [left, bottom, right, top],
+        rtol=0.0001,
+    )
 
 
+@pytest.mark.stac
 def test_convert_bbox_to_stl__ensure_z_offset_is_correct(
-    output_file, hawaii_bbox
+    output_file, hawaii_bbox, tmp_path
 ) -> None:
     path1 = convert_bbox_to_stl(
         bbox_geometry=hawaii_bbox,
@@ -119,16 +133,19 @@ def test_convert_bbox_to_stl__ensure_z_offset_is_correct(
         ensure_squared=True,
         allow_caching=False,
         compress=False,
+        cache_dir=tmp_path,
     )
     x1, y1, z1 = get_dimensions_of_stl_file(path1)
 
+    # the tiff fetched above can be reused for the remaining z_offsets
     path2 = convert_bbox_to_stl(
         bbox_geometry=hawaii_bbox,
         output_file=output_file,
         z_offset=10.0,  # setting z_offset=10.0 will ensure an offset of 10.0mm
         ensure_squared=True,
-        allow_caching=False,
+        allow_caching=True,
         compress=False,
+        cache_dir=tmp_path,
     )
     x2, y2, z2 = get_dimensions_of_stl_file(path2)
 
@@ -137,8 +154,9 @@ def test_convert_bbox_to_stl__ensure_z_offset_is_correct(
         output_file=output_file,
         z_offset=0.0,  # setting z_offset=0.0 will ensure an offset of 0.0mm
         ensure_squared=True,
-        allow_caching=False,
+        allow_caching=True,
         compress=False,
+        cache_dir=tmp_path,
     )
     x3, y3, z3 = get_dimensions_of_stl_file(path3)
 
@@ -147,6 +165,7 @@ def test_convert_bbox_to_stl__ensure_z_offset_is_correct(
     assert z1 > z2 > z3
 
 
+@pytest.mark.stac
 def test_convert_bbox_to_stl__progress_bar(
     output_file, geojson_bbox_two_stac_items, progress_bar, mock_max_res
 ) -> None:
@@ -161,9 +180,10 @@ def test_convert_bbox_to_stl__progress_bar(
     # we expect 10 steps, 2 for fetching stac items, 4 for generating
     # the 4 stl files and another 4 for compressing the tiles
     assert len(progress_bar.progress_track) == 10
-    assert progress_bar.progress_track == [11, 22, 33, 44, 55, 66, 77, 88, 99, 100]
+    assert progress_bar.progress_track == [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
 
 
+@pytest.mark.stac
 def test_mapa__index_error(output_file) -> None:
     # chose a very tiny area, which in turn will create a very tiny array, i.e. array with one element only
     bbox = {
@@ -188,8 +208,15 @@ def test_mapa__index_error(output_file) -> None:
     )
 
 
+@pytest.mark.usefixtures("mock_tiff_for_bbox")
 @pytest.mark.parametrize("compress", (False, True))
-def test_mapa__split_area_into_tiles__success(hawaii_bbox, tmp_path, compress) -> None:
+def test_mapa__split_area_into_tiles__success(
+    hawaii_bbox, tmp_path, compress, monkeypatch
+) -> None:
+    # the compression ratio is irrelevant for this test, thus only store the files in the zip archive
+    monkeypatch.setattr(
+        mapa, "create_zip_archive", partial(create_zip_archive, compression="store")
+    )
     size = 100
     output_path = Path(tmp_path, "foo")
     output = convert_bbox_to_stl(
@@ -223,6 +250,7 @@ def test_mapa__split_area_into_tiles__success(hawaii_bbox, tmp_path, compress) -
         assert y == size / 2
 
 
+@pytest.mark.usefixtures("mock_tiff_for_bbox")
 def test_mapa__split_area_into_tiles__one_by_two(hawaii_bbox, output_file) -> None:
     size = 100
     # first round we have 1 by 2
@@ -267,6 +295,7 @@ def test_mapa__split_area_into_tiles__one_by_two(hawaii_bbox, output_file) -> No
     assert math.isclose(y2, size, rel_tol=0.03)
 
 
+@pytest.mark.stac
 def test_mapa__split_area_into_tiles__area_too_small(output_file) -> None:
     bbox = {
         "type": "Polygon",
@@ -294,6 +323,7 @@ def test_mapa__split_area_into_tiles__area_too_small(output_file) -> None:
         )
 
 
+@pytest.mark.stac
 @pytest.mark.parametrize("ensure_squared", (False, True))
 def test_mapa__ensure_squared__two_by_two(
     ensure_squared, output_file, hawaii_bbox
@@ -323,6 +353,7 @@ def test_mapa__ensure_squared__two_by_two(
     assert y3 + y4 == size
 
 
+@pytest.mark.stac
 def test_mapa__interplay_of_ensure_squared_with_tiling(
     output_file, hawaii_bbox
 ) -> None:
@@ -365,6 +396,7 @@ def test_mapa__interplay_of_ensure_squared_with_tiling(
     assert y2 == size / 2
 
 
+@pytest.mark.stac
 def test_mapa__tiling_with_rectangular_bbox(
     geojson_bbox_two_stac_items, output_file, mock_max_res
 ) -> None:
@@ -423,6 +455,7 @@ def test_mapa__tiling_with_rectangular_bbox(
     assert y4 + y5 + y6 == size
 
 
+@pytest.mark.stac
 def test_custom_caching_path(output_file, geojson_bbox, tmp_path) -> None:
     start = time.time()
     output_file = convert_bbox_to_stl(
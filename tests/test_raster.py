@@ -2,12 +2,15 @@ import numpy as np
 import pytest
 import rasterio as rio
 from haversine import haversine
+from rasterio.windows import from_bounds
 
 from mapa.raster import (
     _get_coordinate_of_pixel,
     clip_tiff_to_bbox,
     cut_array_to_square,
     determine_elevation_scale,
+    merge_tiffs,
+    merge_tiffs_in_memory,
     remove_empty_first_and_last_rows_and_cols,
     tiff_to_array,
 )
@@ -16,8 +19,8 @@ from mapa.utils import TMPDIR
 
 
 def test_tiff_to_2_dimensional_array(test_tiff) -> None:
-    tiff = rio.open(test_tiff)
-    array = tiff_to_array(tiff)
+    with rio.open(test_tiff) as tiff:
+        array = tiff_to_array(tiff)
     assert len(array.shape) == 2
 
 
@@ -42,7 +45,7 @@ def test_cut_array_to_square() -> None:
     assert result.shape == (2, 2)
 
 
-def test_clip_tiff_to_bbox(test_tiff) -> None:
+def test_clip_tiff_to_bbox(test_tiff, tmp_path) -> None:
     # bbox does not overlap tiff raster coordinates
     bbox = {
         "type": "Polygon",
@@ -57,7 +60,7 @@ def test_clip_tiff_to_bbox(test_tiff) -> None:
         ],
     }
     with pytest.raises(ValueError, match="Input shapes do not overlap raster."):
-        clip_tiff_to_bbox(test_tiff, bbox, "foo", cache_dir=TMPDIR())
+        clip_tiff_to_bbox(test_tiff, bbox, "foo", cache_dir=tmp_path)
 
     # bbox does overlap tiff raster coordinates
     bbox = {
@@ -72,19 +75,48 @@ def test_clip_tiff_to_bbox(test_tiff) -> None:
             ]
         ],
     }
-    clipped_tiff = clip_tiff_to_bbox(test_tiff, bbox, "foo", cache_dir=TMPDIR())
-    test_array = tiff_to_array(rio.open(test_tiff))
-    clipped_array = tiff_to_array(rio.open(clipped_tiff))
+    clipped_tiff = clip_tiff_to_bbox(test_tiff, bbox, "foo", cache_dir=tmp_path)
+    with rio.open(clipped_tiff) as tiff:
+        clipped_array = tiff_to_array(tiff)
+        bounds = tiff.bounds
+        nodata = tiff.nodata
+    with rio.open(test_tiff) as tiff:
+        test_array = tiff_to_array(tiff)
+        # read the window of the input tiff, which corresponds to the clipped tiff
+        window = from_bounds(*bounds, transform=tiff.transform)
+        window_array = tiff.read(1, window=window.round_offsets().round_lengths())
 
     assert test_array.shape > clipped_array.shape
-    overlap = np.isin(clipped_array, test_array)
-    # remove all False entries
-    overlap = overlap[
-        np.ix_(~np.all(overlap == False, axis=1), ~np.all(overlap == False, axis=0))  # noqa: E712
-    ]
-    # need to add +1 since rasterio seems to add additional row and col with all zeros...
-    assert overlap.shape[0] + 1 == clipped_array.shape[0]
-    assert overlap.shape[1] + 1 == clipped_array.shape[1]
+    assert window_array.shape == clipped_array.shape
+    # rasterio masks the pixels at the border, which are only partially covered by the bbox, all others are equal
+    valid = clipped_array != nodata
+    assert valid[1:-1, 1:-1].all()
+    np.testing.assert_array_equal(window_array[valid], clipped_array[valid])
+
+
+def test_merge_tiffs_in_memory(test_tiff, tmp_path) -> None:
+    bbox = {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [-156.0, 20.0],
+                [-156.0, 18.9],
+                [-154.8, 18.9],
+                [-154.8, 20.0],
+                [-156.0, 20.0],
+            ]
+        ],
+    }
+    merged_tiff = merge_tiffs([test_tiff, test_tiff], "foo", cache_dir=tmp_path)
+    clipped_tiff = clip_tiff_to_bbox(merged_tiff, bbox, "foo", cache_dir=tmp_path)
+    with rio.open(clipped_tiff) as tiff:
+        expected = tiff_to_array(tiff)
+
+    # clipping the in memory merged tiff needs to give the same result as clipping the one on disk
+    with merge_tiffs_in_memory([test_tiff, test_tiff]) as merged_tiff:
+        clipped_tiff = clip_tiff_to_bbox(merged_tiff, bbox, "bar", cache_dir=tmp_path)
+    with rio.open(clipped_tiff) as tiff:
+        np.testing.assert_array_equal(expected, tiff_to_array(tiff))
 
 
 def test_remove_empty_first_and_last_rows_and_cols() -> None:
@@ -235,25 +267,26 @@ def test_remove_empty_first_and_last_rows_and_cols() -> None:
     np.testing.assert_array_equal(expected, result)
 
 
+@pytest.mark.stac
 def test_determine_z_scale(geojson_bbox, mock_file_download) -> None:
     tiff_path = fetch_stac_items_for_bbox(
         geojson_bbox, allow_caching=False, cache_dir=TMPDIR()
     )
-    tiff = rio.open(tiff_path[0])
-    scale = determine_elevation_scale(tiff, model_size=200)
+    with rio.open(tiff_path[0]) as tiff:
+        scale = determine_elevation_scale(tiff, model_size=200)
     expected_scale = 0.0013862643986006134
     assert expected_scale == scale
 
 
 def test__get_coordinate_of_pixel(test_tiff) -> None:
-    tiff = rio.open(test_tiff)
-    c1 = _get_coordinate_of_pixel(0, 0, tiff)
-    c2 = _get_coordinate_of_pixel(0, 1, tiff)
-    assert c1 == (20.30046320308474, -156.14972920662672)
-    assert c2 == (20.30046320308474, -156.13176290094432)
+    with rio.open(test_tiff) as tiff:
+        c1 = _get_coordinate_of_pixel(0, 0, tiff)
+        c2 = _get_coordinate_of_pixel(0, 1, tiff)
+        c3 = _get_coordinate_of_pixel(0, 0, tiff)
+        c4 = _get_coordinate_of_pixel(0, 80, tiff)
+    # compare with a tolerance, since the last bits of the coordinates may depend on the build of the affine math
+    assert c1 == pytest.approx((20.30046320308474, -156.14972920662672), abs=1e-12)
+    assert c2 == pytest.approx((20.30046320308474, -156.13176290094432), abs=1e-12)
     assert c1 != c2
-    assert haversine(c1, c2) == 1.873675897353747
-
-    c3 = _get_coordinate_of_pixel(0, 0, tiff)
-    c4 = _get_coordinate_of_pixel(0, 80, tiff)
-    assert haversine(c3, c4) == 149.89359874800192
+    assert haversine(c1, c2) == pytest.approx(1.873675897353747, abs=1e-9)
+    assert haversine(c3, c4) == pytest.approx(149.89359874800192, abs=1e-9)
@@ -1,5 +1,22 @@
-from mapa.stac import _download_file, _turn_geojson_into_bbox, fetch_stac_items_for_bbox
-from mapa.utils import TMPDIR
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mapa import stac
+from mapa.stac import (
+    _download_file,
+    _get_tiff_file,
+    _search_stac_items,
+    _turn_geojson_into_bbox,
+    _write_stac_items,
+    fetch_stac_items_for_bbox,
+)
+from mapa.utils import TMPDIR, ProgressBar
 
 
 def test__turn_geojson_into_bbox(geojson_bbox):
@@ -11,6 +28,7 @@ def test__turn_geojson_into_bbox(geojson_bbox):
     ]
 
 
+@pytest.mark.stac
 def test_fetch_stac_items_for_bbox(mock_file_download):
     multiple_stac_items_bbox = {
         "type": "Polygon",
@@ -30,9 +48,132 @@ def test_fetch_stac_items_for_bbox(mock_file_download):
     assert len(tiffs) == 2
 
 
+@pytest.mark.stac
 def test__download_file(tmp_path) -> None:
     # little test to verify downloading file works, everywhere else the _download_file func will be mocked
     file = tmp_path / "foo.txt"
     url = "https://raw.githubusercontent.com/fgebhart/mapa/main/README.md"
     path = _download_file(url, local_file=file)
     assert path.is_file()
+
+
+def test__download_file__local_url(test_tiff, tmp_path) -> None:
+    # same code path as downloading via https, but without requiring network access
+    file = tmp_path / "foo.tiff"
+    path = _download_file(test_tiff.resolve().as_uri(), local_file=file)
+    assert path == file
+    assert path.read_bytes() == test_tiff.read_bytes()
+
+
+@pytest.fixture
+def mock_stac_client(monkeypatch):
+    class Client:
+        def search(self, collections, bbox):
+            items = [
+                SimpleNamespace(
+                    id=i, assets={"data": SimpleNamespace(href=f"https://foo/{i}.tif")}
+                )
+                for i in ("a", "b")
+            ]
+            return SimpleNamespace(items=lambda: iter(items))
+
+    monkeypatch.setattr(stac, "_open_client", lambda: Client())
+
+
+def test__search_stac_items__cached(tmp_path, monkeypatch, mock_stac_client) -> None:
+    bbox = [8.076906, 48.098505, 8.107111, 48.115011]
+    expected = [("a", "https://foo/a.tif"), ("b", "https://foo/b.tif")]
+    assert (
+        list(_search_stac_items(bbox, allow_caching=True, cache_dir=tmp_path))
+        == expected
+    )
+    assert len(list(tmp_path.glob("stac_items_*.json"))) == 1
+
+    # a second search with the same bbox is served from the cache without querying the STAC API
+    def _fail():
+        raise AssertionError("STAC API should not be queried")
+
+    monkeypatch.setattr(stac, "_open_client", _fail)
+    assert (
+        list(_search_stac_items(bbox, allow_caching=True, cache_dir=tmp_path))
+        == expected
+    )
+
+    # disabling caching queries the STAC API again
+    with pytest.raises(AssertionError, match="should not be queried"):
+        list(_search_stac_items(bbox, allow_caching=False, cache_dir=tmp_path))
+
+
+def test__search_stac_items__no_caching(tmp_path, mock_stac_client) -> None:
+    bbox = [8.076906, 48.098505, 8.107111, 48.115011]
+    assert len(list(_search_stac_items(bbox, False, cache_dir=tmp_path))) == 2
+    # with caching disabled, nothing must be persisted to the cache dir
+    assert list(tmp_path.iterdir()) == []
+
+
+def test__write_stac_items__concurrent_writers(tmp_path, monkeypatch) -> None:
+    cached_items = tmp_path / "stac_items_foo.json"
+    # let both writers finish their temporary file before either of them moves it into place
+    barrier = threading.Barrier(2)
+    replace = os.replace
+
+    def _replace(src, dst):
+        barrier.wait(timeout=10)
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", _replace)
+    items = {t: [(t, f"https://foo/{t}.tif")] for t in ("a", "b")}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_write_stac_items, i, cached_items) for i in items.values()
+        ]
+        for future in futures:
+            future.result()
+
+    assert [tuple(i) for i in json.loads(cached_items.read_text())] in items.values()
+    # no temporary files are left behind
+    assert list(tmp_path.iterdir()) == [cached_items]
+
+
+def test_fetch_stac_items_for_bbox__progress_bar(
+    geojson_bbox,
+    tmp_path,
+    mock_stac_client,
+    mock_file_download,
+    progress_bar,
+    test_tiff,
+) -> None:
+    bar = ProgressBar(progress_bar=progress_bar, steps=2)
+    tiffs = fetch_stac_items_for_bbox(
+        geojson_bbox, allow_caching=False, cache_dir=tmp_path, progress_bar=bar
+    )
+    assert tiffs == [test_tiff, test_tiff]
+    # the number of steps got increased by the number of found stac items
+    assert bar.steps == 4
+    assert progress_bar.progress_track == [25, 50]
+
+
+def test__get_tiff_file__only_reuses_complete_downloads(tmp_path, monkeypatch) -> None:
+    downloads = []
+
+    def _mocked_download_file(url: str, local_file: Path) -> Path:
+        downloads.append(url)
+        local_file.write_bytes(b"tiff")
+        return local_file
+
+    monkeypatch.setattr(stac, "_download_file", _mocked_download_file)
+
+    # a left over (e.g. partially downloaded) tiff without marker gets downloaded again
+    (tmp_path / "foo.tiff").write_bytes(b"")
+    tiff = _get_tiff_file("foo", "https://foo/foo.tif", True, tmp_path, count=1)
+    assert tiff == tmp_path / "foo.tiff"
+    assert len(downloads) == 1
+
+    # a completed download is reused
+    tiff = _get_tiff_file("foo", "https://foo/foo.tif", True, tmp_path, count=1)
+    assert tiff.read_bytes() == b"tiff"
+    assert len(downloads) == 1
+
+    # unless caching is disabled
+    _get_tiff_file("foo", "https://foo/foo.tif", False, tmp_path, count=1)
+    assert len(downloads) == 2
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from stl import mesh
+
+from mapa import stl_file
+from mapa.stl_file import STL_DTYPE, get_dimensions_of_stl_file, save_to_stl_file
+
+
+@pytest.mark.parametrize("parallel", (False, True))
+def test_save_to_stl_file__binary(tmp_path, monkeypatch, parallel) -> None:
+    if parallel:
+        monkeypatch.setattr(stl_file, "PARALLEL_STL_WRITE_THRESHOLD", 0)
+    triangles = np.array(
+        [
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+            [[0.0, 0.0, 1.0], [0.0, 2.0, 1.0], [3.0, 0.0, 1.0]],
+            [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0], [1.0, 1.0, 1.0]],  # degenerated triangle
+        ]
+    )
+    output_file = tmp_path / "output.stl"
+    save_to_stl_file(triangles, output_file, as_ascii=False)
+
+    assert output_file.stat().st_size == 84 + len(triangles) * STL_DTYPE.itemsize
+    # verify numpy-stl is able to read the file
+    stl = mesh.Mesh.from_file(output_file)
+    np.testing.assert_array_equal(triangles, stl.vectors)
+
+    records = np.fromfile(output_file, dtype=STL_DTYPE, offset=84)
+    expected_normals = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, -1.0], [0.0, 0.0, 0.0]])
+    np.testing.assert_array_equal(expected_normals, records["normals"])
+
+
+def test_get_dimensions_of_stl_file(test_stl_binary, test_stl_ascii) -> None:
+    dims_binary = get_dimensions_of_stl_file(test_stl_binary)
+    dims_ascii = get_dimensions_of_stl_file(test_stl_ascii)
+    assert dims_binary == dims_ascii
+    x, y, z = dims_binary
+    assert x == 200.0
+    assert y == 192.5
+    assert z > 0.0
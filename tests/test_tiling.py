@@ -27,20 +27,7 @@ def test_split_array_into_tiles__square() -> None:
         ]
     )
     blocks = split_array_into_tiles(three_by_three, tiles_format=TileFormat(x=3, y=3))
-    expected = list(
-        [
-            np.array([[1]]),
-            np.array([[2]]),
-            np.array([[3]]),
-            np.array([[5]]),
-            np.array([[6]]),
-            np.array([[7]]),
-            np.array([[9]]),
-            np.array([[0]]),
-            np.array([[1]]),
-        ]
-    )
-
+    expected = np.array([1, 2, 3, 5, 6, 7, 9, 0, 1]).reshape(9, 1, 1)
     np.testing.assert_array_equal(expected, blocks)
 
     # four by four into 3x3
@@ -118,6 +105,7 @@ def test_get_x_y_from_tiles_format() -> None:
     # valid examples
     assert get_x_y_from_tiles_format("3x3") == TileFormat(x=3, y=3)
     assert get_x_y_from_tiles_format("2x10") == TileFormat(x=2, y=10)
+    assert get_x_y_from_tiles_format("10x10") == TileFormat(x=10, y=10)
 
     # invalid examples
     error_msg = "Invalid format"
@@ -130,5 +118,8 @@ def test_get_x_y_from_tiles_format() -> None:
     with pytest.raises(ValueError, match=error_msg):
         get_x_y_from_tiles_format("0x0")
 
-    with pytest.raises(ValueError, match="invalid literal for int"):
+    with pytest.raises(ValueError, match=error_msg):
+        get_x_y_from_tiles_format("0x5")
+
+    with pytest.raises(ValueError, match=error_msg):
         get_x_y_from_tiles_format("axf")
@@ -0,0 +1,32 @@
+from mapa.utils import ProgressBar, md5_sum, md5_sums
+
+
+def test_progress_bar(progress_bar) -> None:
+    bar = ProgressBar(progress_bar=progress_bar, steps=1)
+    bar.step()
+    assert progress_bar.progress_track == [100]
+
+
+def test_progress_bar__only_updates_on_change(progress_bar) -> None:
+    bar = ProgressBar(progress_bar=progress_bar, steps=1000)
+    for _ in range(1000):
+        bar.step()
+    assert progress_bar.progress_track == list(range(0, 101))
+
+    # exceeding the number of steps does not exceed 100 percent
+    bar.step()
+    assert progress_bar.progress_track == list(range(0, 101))
+
+
+def test_md5_sums(tmp_path) -> None:
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"file_{i}.bin"
+        path.write_bytes(bytes([i]) * (2 * 1024 * 1024 + i))
+        paths.append(path)
+
+    checksums = md5_sums(paths)
+    assert list(checksums) == paths
+    assert list(checksums.values()) == [md5_sum(p) for p in paths]
+    assert len(set(checksums.values())) == 3
+    assert md5_sums([]) == {}
@@ -1,5 +1,6 @@
+from hashlib import md5
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_STORED, ZipFile
 
 import pytest
 
@@ -49,17 +50,9 @@ def test_create_zip_archive(file_a, file_b, tmp_path) -> None:
         assert content_a == content_a_zip
         assert content_b == content_b_zip
 
-        # extract members
-        zip_file.extract(file_a.name, tmp_path)
-        zip_file.extract(file_b.name, tmp_path)
-
-    a_unzipped = tmp_path / file_a.name
-    b_unzipped = tmp_path / file_b.name
-    assert a_unzipped.is_file()
-    assert b_unzipped.is_file()
-
-    assert checksum_a == md5_sum(a_unzipped)
-    assert checksum_b == md5_sum(b_unzipped)
+        # verify checksums of the members in memory, there is no need to extract them to disk
+        assert checksum_a == md5(zip_file.read(file_a.name)).hexdigest()
+        assert checksum_b == md5(zip_file.read(file_b.name)).hexdigest()
 
 
 def test_create_zip_archive__compression_impact(test_stl_binary, output_file) -> None:
@@ -72,3 +65,20 @@ def test_create_zip_archive__compression_impact(test_stl_binary, output_file) ->
 
     # compressing a usual STL file reduces the size by more than a factor of 4
     assert compressed < uncompressed / 4
+
+
+def test_create_zip_archive__store(test_stl_binary, output_file) -> None:
+    uncompressed = test_stl_binary.stat().st_size
+    output = create_zip_archive(
+        files=[test_stl_binary], output_file=f"{output_file}.zip", compression="store"
+    )
+    assert output.stat().st_size > uncompressed
+
+    with ZipFile(output) as zip_file:
+        assert zip_file.getinfo(test_stl_binary.name).compress_type == ZIP_STORED
+        assert zip_file.read(test_stl_binary.name) == test_stl_binary.read_bytes()
+
+    with pytest.raises(ValueError, match="Invalid compression 'foo'"):
+        create_zip_archive(
+            files=[test_stl_binary], output_file=output, compression="foo"
+        )